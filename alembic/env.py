@@ -37,9 +37,9 @@ def set_sqlalchemy_url():
 
     """
     env = get_all_settings()
-    pg_url = (f"postgresql://{env.postgres_user}:{env.postgres_password}@"
-              f"{env.postgres_host}:{env.postgres_port}/{env.postgres_db}")
-    config.set_main_option("sqlalchemy.url", pg_url)
+    pg_url = env.pg_url.render_as_string(hide_password=False)
+    # The config uses % for interpolation so it must be escaped.
+    config.set_main_option("sqlalchemy.url", pg_url.replace("%", "%%"))
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,42 @@
+"""Add composite index on inference device_id and session_date.
+
+The composite index replaces the index on device_id alone.
+
+Revision ID: 5e0b7d2c9a41
+Revises: 28b7fe4253cc
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b7d2c9a41'
+down_revision: Union[str, Sequence[str], None] = '28b7fe4253cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_inference_device_id_session_date',
+        'inference',
+        ['device_id', 'session_date'],
+        unique=False
+    )
+    op.drop_index(op.f('ix_inference_device_id'), table_name='inference')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_inference_device_id'),
+        'inference',
+        ['device_id'],
+        unique=False
+    )
+    op.drop_index(
+        'ix_inference_device_id_session_date', table_name='inference')
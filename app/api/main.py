@@ -1,5 +1,3 @@
-# Importing sqlmodels ensures the tables are created in the database on reset.
-import app.sqlmodels  # noqa F401
 from app.env import EnvDependency
 from app.auth import router as auth_router
 from app.api.routes.organisation import router as organisation_router
@@ -7,7 +7,7 @@ from sqlmodel import Session, select
 
 from app.auth import hash_password, AdminDependency
 from app.constants import Role
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.env import EnvDependency
 from app.sqlmodels import Account
 from app.api.routes.organisation import organisation_exists
@@ -47,14 +47,14 @@ class AccountPatch(BaseModel):
 
 
 @router.get('/', summary="List accounts.", response_model=list[AccountGet])
-async def get_accounts(
+def get_accounts(
     db: DbDependency,
     account: AdminDependency,
     role: Optional[Role] = None,
     disabled: bool = False,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     """Get all accounts."""
     query = (
@@ -83,7 +83,7 @@ async def get_accounts(
 
 
 @router.get('/{name}', summary="Get account.", response_model=AccountGet)
-async def get_account(
+def get_account(
     db: DbDependency,
     account: AdminDependency,
     name: str
@@ -97,7 +97,7 @@ async def get_account(
 
 
 @router.post('', summary="Create account.", response_model=AccountGet)
-async def create_account(
+def create_account(
     db: DbDependency,
     env: EnvDependency,
     account: AdminDependency,
@@ -162,7 +162,7 @@ async def create_account(
 
 
 @router.patch("/{name}",  summary="Update account.", response_model=AccountGet)
-async def update_account(
+def update_account(
     db: DbDependency,
     env: EnvDependency,
     account: AdminDependency,
@@ -215,8 +215,12 @@ async def update_account(
     return current_account
 
 
-@router.delete("/{name}", summary="Delete account.")
-async def delete_account(
+@router.delete(
+    "/{name}",
+    summary="Delete account.",
+    response_model=dict[str, bool]
+)
+def delete_account(
     db: DbDependency,
     env: EnvDependency,
     account: AdminDependency,
@@ -257,7 +261,7 @@ async def delete_account(
     summary="Undelete account.",
     response_model=AccountGet
 )
-async def undelete_account(
+def undelete_account(
     db: DbDependency,
     account: AdminDependency,
     name: str
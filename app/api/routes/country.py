@@ -2,9 +2,10 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Country, Network
 
 logger = logging.getLogger()
@@ -25,8 +26,11 @@ class CountryFull(CountryBase):
     summary="List countries.",
     response_model=list[CountryFull]
 )
-async def get_countries(
-    db: DbDependency, deleted: bool = False, offset: int = 0, limit: int = 100
+def get_countries(
+    db: DbDependency,
+    deleted: bool = False,
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     countries = db.exec(
         select(Country).
@@ -42,14 +46,14 @@ async def get_countries(
     summary="Country details.",
     response_model=CountryFull
 )
-async def get_country(db: DbDependency, code: str):
+def get_country(db: DbDependency, code: str):
     return get_country_by_code(db, code)
 
 
 @router.post(
     "/", summary="Create country.", response_model=CountryFull
 )
-async def create_country(
+def create_country(
     db: DbDependency, body: CountryFull
 ):
     if country_exists(db, body.code):
@@ -75,7 +79,7 @@ async def create_country(
     summary="Update country.",
     response_model=CountryFull
 )
-async def update_country(
+def update_country(
     db: DbDependency, code: str, body: CountryBase
 ):
     current_country = get_country_by_code(db, code)
@@ -92,8 +96,12 @@ async def update_country(
     return current_country
 
 
-@router.delete("/{code}", summary="Delete country.")
-async def delete_country(code: str, db: DbDependency):
+@router.delete(
+    "/{code}",
+    summary="Delete country.",
+    response_model=dict[str, bool]
+)
+def delete_country(code: str, db: DbDependency):
     if country_used(db, code):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -115,7 +123,7 @@ async def delete_country(code: str, db: DbDependency):
     summary="Undelete country.",
     response_model=CountryFull
 )
-async def undelete_organisation(db: DbDependency, name: str):
+def undelete_organisation(db: DbDependency, name: str):
     country = get_country_by_code(db, name, True)
     try:
         country.deleted = False
@@ -145,8 +153,10 @@ def get_country_by_code(db: Session, code: str, deleted: bool = False):
 
 def country_exists(db: Session, code: str):
     code = code.upper()
+    # Only the deleted flag is needed to determine existence.
     country = db.exec(
         select(Country).
+        options(load_only(Country.deleted)).
         where(Country.code == code)
     ).first()
     if country and country.deleted:
@@ -4,11 +4,12 @@ from alembic.script import ScriptDirectory
 from alembic import command
 import logging
 
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import FileResponse
-from sqlmodel import SQLModel
 
 from app.auth import get_current_root_account
+from app.database import init_db, delete_db
+from app.env import EnvDependency
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,12 @@ router = APIRouter(
 )
 
 
-@router.get("/current", summary="Get current database revision.")
-async def current(request: Request):
+@router.get(
+    "/current",
+    summary="Get current database revision.",
+    response_model=dict[str, str | None]
+)
+def current(request: Request):
     # We don't use command.current() as it does not return a value.
     # It only prints it to stdout.
     engine = request.app.state.engine
@@ -30,8 +35,12 @@ async def current(request: Request):
     return {"revision": value}
 
 
-@router.get("/history", summary="Get revision history.")
-async def history(request: Request):
+@router.get(
+    "/history",
+    summary="Get revision history.",
+    response_model=dict[str, str | None]
+)
+def history(request: Request):
     # We don't use command.history() as it does not return a value.
     # It only prints it to stdout.
     config = Config('alembic.ini')
@@ -42,15 +51,23 @@ async def history(request: Request):
     return values
 
 
-@router.put("/upgrade", summary="Upgrade the database.")
-async def upgrade(revision='head'):
+@router.put(
+    "/upgrade",
+    summary="Upgrade the database.",
+    response_model=dict[str, bool]
+)
+def upgrade(revision='head'):
     config = Config('alembic.ini')
     command.upgrade(config, revision)
     return {"ok": True}
 
 
-@router.put("/downgrade", summary="Downgrade the database.")
-async def downgrade(revision='head'):
+@router.put(
+    "/downgrade",
+    summary="Downgrade the database.",
+    response_model=dict[str, bool]
+)
+def downgrade(revision='head'):
     """Downgrade the database to the given revision.
 
     Warning: Downgrading can delete data!
@@ -62,7 +79,7 @@ async def downgrade(revision='head'):
 
 
 @router.get("/revision", summary="Autogenerate database revision.")
-async def revision():
+def revision():
     # The lambda section points to a writable file destination.
     config = Config('alembic.ini', ini_section='lambda')
     print("Autogenerating revision...")
@@ -75,16 +92,34 @@ async def revision():
     return FileResponse("/tmp/alembic/revision.py")
 
 
-@router.put("/stamp", summary="Stamp the revision table with the given value.")
-async def stamp(revision='heads'):
+@router.put(
+    "/stamp",
+    summary="Stamp the revision table with the given value.",
+    response_model=dict[str, bool]
+)
+def stamp(revision='heads'):
     config = Config('alembic.ini')
     command.stamp(config, revision)
     return {"ok": True}
 
 
-@router.delete("/reset", summary="Reset the database, deleting all contents.")
-async def reset(request: Request):
+@router.delete(
+    "/reset",
+    summary="Reset the database, deleting all contents.",
+    response_model=dict[str, bool]
+)
+def reset(request: Request, env: EnvDependency):
+    """Drop and recreate all tables.
+
+    Not available in production, where the schema is created and updated
+    with the upgrade endpoint.
+    """
+    if env.environment == 'prod':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The database cannot be reset in production.")
     engine = request.app.state.engine
-    SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+    delete_db(engine)
+    # The tables have just been dropped so there is no need to check for them.
+    init_db(engine, checkfirst=False)
     return {"ok": True}
@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Deployment, Device, DeploymentDevice, Network
 from app.api.routes.network import network_exists
 from app.api.routes.devicetype import devicetype_exists
@@ -33,7 +33,7 @@ class DeploymentFull(DeploymentBase):
     summary="List deployments.",
     response_model=list[DeploymentFull]
 )
-async def get_deployments(
+def get_deployments(
     db: DbDependency,
     organisation_name: str | None = None,
     country_code: str | None = None,
@@ -42,8 +42,8 @@ async def get_deployments(
     devicetype_name: str | None = None,
     active: bool = True,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     sql = (select(Deployment).
            join(Network, Network.id == Deployment.network_id).
@@ -74,14 +74,14 @@ async def get_deployments(
     summary="Deployment details.",
     response_model=DeploymentFull
 )
-async def get_deployment(db: DbDependency, id: int):
+def get_deployment(db: DbDependency, id: int):
     return get_deployment_by_id(db, id)
 
 
 @router.post(
     "/", summary="Create deployment.", response_model=DeploymentFull
 )
-async def create_deployment(
+def create_deployment(
     db: DbDependency, body: DeploymentBase
 ):
     check_valid_deployment(db, body)
@@ -103,7 +103,7 @@ async def create_deployment(
     summary="Update deployment.",
     response_model=DeploymentFull
 )
-async def update_deployment(
+def update_deployment(
     db: DbDependency, id: int, body: DeploymentBase
 ):
     check_valid_deployment(db, body, id)
@@ -122,8 +122,12 @@ async def update_deployment(
     return current_deployment
 
 
-@router.delete("/{id}", summary="Delete deployment.")
-async def delete_deployment(db: DbDependency, id: int):
+@router.delete(
+    "/{id}",
+    summary="Delete deployment.",
+    response_model=dict[str, bool]
+)
+def delete_deployment(db: DbDependency, id: int):
     if deployment_used(db, id):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -145,7 +149,7 @@ async def delete_deployment(db: DbDependency, id: int):
     summary="Undelete deployment.",
     response_model=DeploymentFull
 )
-async def undelete_deployment(db: DbDependency, id: int):
+def undelete_deployment(db: DbDependency, id: int):
     deployment = get_deployment_by_id(db, id, True)
     check_valid_deployment(db, deployment)
     try:
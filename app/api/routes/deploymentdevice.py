@@ -5,7 +5,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import DeploymentDevice, Deployment
 from app.api.routes.deployment import deployment_exists
 from app.api.routes.device import device_exists
@@ -31,13 +31,13 @@ class DeploymentDeviceFull(DeploymentDeviceBase):
     summary="List deployment-devices.",
     response_model=list[DeploymentDeviceFull]
 )
-async def get_deploymentdevices(
+def get_deploymentdevices(
     db: DbDependency,
     device_id: str = None,
     deployment_id: int = None,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     sql = (select(DeploymentDevice).
            where(DeploymentDevice.deleted == deleted).
@@ -57,7 +57,7 @@ async def get_deploymentdevices(
     summary="Deploymnet-device details.",
     response_model=DeploymentDeviceFull
 )
-async def get_deploymentdevice(db: DbDependency, id: int):
+def get_deploymentdevice(db: DbDependency, id: int):
     return get_deploymentdevice_by_id(db, id)
 
 
@@ -66,7 +66,7 @@ async def get_deploymentdevice(db: DbDependency, id: int):
     summary="Create deployment-device.",
     response_model=DeploymentDeviceFull
 )
-async def create_deploymentdevice(
+def create_deploymentdevice(
     db: DbDependency, body: DeploymentDeviceBase
 ):
     check_valid_deploymentdevice(db, body)
@@ -87,7 +87,7 @@ async def create_deploymentdevice(
     summary="Update deployment-device.",
     response_model=DeploymentDeviceFull
 )
-async def update_deploymentdevice(
+def update_deploymentdevice(
     db: DbDependency, id: int, body: DeploymentDeviceBase
 ):
     check_valid_deploymentdevice(db, body)
@@ -105,8 +105,12 @@ async def update_deploymentdevice(
     return current_device
 
 
-@router.delete("/{id}", summary="Delete deployment-device.")
-async def delete_deploymentdevice(db: DbDependency, id: int):
+@router.delete(
+    "/{id}",
+    summary="Delete deployment-device.",
+    response_model=dict[str, bool]
+)
+def delete_deploymentdevice(db: DbDependency, id: int):
     deploymentdevice = get_deploymentdevice_by_id(db, id)
     try:
         deploymentdevice.deleted = True
@@ -124,7 +128,7 @@ async def delete_deploymentdevice(db: DbDependency, id: int):
     summary="Undelete deployment-device.",
     response_model=DeploymentDeviceFull
 )
-async def undelete_deploymentdevice(db: DbDependency, name: str):
+def undelete_deploymentdevice(db: DbDependency, name: str):
     deploymentdevice = get_deploymentdevice_by_id(db, name, True)
     check_valid_deploymentdevice(db, deploymentdevice)
     try:
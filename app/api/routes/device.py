@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Device, DeploymentDevice, Inference
 from app.api.routes.deployment import deployment_exists
 from app.api.routes.devicetype import devicetype_exists
@@ -31,12 +31,12 @@ class DeviceFull(DeviceBase):
     summary="List devices.",
     response_model=list[DeviceFull]
 )
-async def get_devices(
+def get_devices(
     db: DbDependency,
     devicetype_name: str = None,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     sql = (select(Device).
            where(Device.deleted == deleted).
@@ -54,14 +54,14 @@ async def get_devices(
     summary="Device details.",
     response_model=DeviceFull
 )
-async def get_device(db: DbDependency, id: str):
+def get_device(db: DbDependency, id: str):
     return get_device_by_id(db, id)
 
 
 @router.post(
     "/", summary="Create device.", response_model=DeviceFull
 )
-async def create_device(
+def create_device(
     db: DbDependency, body: DeviceFull
 ):
     if device_exists(db, body.id):
@@ -87,7 +87,7 @@ async def create_device(
     summary="Update device.",
     response_model=DeviceFull
 )
-async def update_device(
+def update_device(
     db: DbDependency, id: str, body: DeviceBase
 ):
     check_valid_device(db, body)
@@ -106,8 +106,12 @@ async def update_device(
     return current_device
 
 
-@router.delete("/{id}", summary="Delete device.")
-async def delete_device(db: DbDependency, id: str):
+@router.delete(
+    "/{id}",
+    summary="Delete device.",
+    response_model=dict[str, bool]
+)
+def delete_device(db: DbDependency, id: str):
     if device_used(db, id):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -129,7 +133,7 @@ async def delete_device(db: DbDependency, id: str):
     summary="Undelete device.",
     response_model=DeviceFull
 )
-async def undelete_device(db: DbDependency, id: str):
+def undelete_device(db: DbDependency, id: str):
     device = get_device_by_id(db, id, True)
     check_valid_device(db, device)
     try:
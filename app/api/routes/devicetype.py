@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import DeviceType, Device, Deployment
 
 logger = logging.getLogger(__name__)
@@ -26,8 +26,11 @@ class DeviceTypeFull(DeviceTypeBase):
     summary="List device types.",
     response_model=list[DeviceTypeFull]
 )
-async def get_devicetypes(
-    db: DbDependency, deleted: bool = False, offset: int = 0, limit: int = 100
+def get_devicetypes(
+    db: DbDependency,
+    deleted: bool = False,
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     devicetypes = db.exec(
         select(DeviceType).
@@ -43,14 +46,14 @@ async def get_devicetypes(
     summary="Device type details.",
     response_model=DeviceTypeFull
 )
-async def get_devicetype(db: DbDependency, name: str):
+def get_devicetype(db: DbDependency, name: str):
     return get_devicetype_by_name(db, name)
 
 
 @router.post(
     "/", summary="Create device type.", response_model=DeviceTypeFull
 )
-async def create_devicetype(
+def create_devicetype(
     db: DbDependency, body: DeviceTypeFull
 ):
     if devicetype_exists(db, body.name):
@@ -76,7 +79,7 @@ async def create_devicetype(
     summary="Update device type.",
     response_model=DeviceTypeFull
 )
-async def update_devicetype(
+def update_devicetype(
     db: DbDependency, name: str, body: DeviceTypeBase
 ):
     current_devicetype = get_devicetype_by_name(db, name)
@@ -93,8 +96,12 @@ async def update_devicetype(
     return current_devicetype
 
 
-@router.delete("/{name}", summary="Delete device type.")
-async def delete_devicetype(db: DbDependency, name: str):
+@router.delete(
+    "/{name}",
+    summary="Delete device type.",
+    response_model=dict[str, bool]
+)
+def delete_devicetype(db: DbDependency, name: str):
     if devicetype_used(db, name):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -116,7 +123,7 @@ async def delete_devicetype(db: DbDependency, name: str):
     summary="Undelete device type.",
     response_model=DeviceTypeFull
 )
-async def undelete_devicetype(db: DbDependency, name: str):
+def undelete_devicetype(db: DbDependency, name: str):
     devicetype = get_devicetype_by_name(db, name, True)
     try:
         devicetype.deleted = False
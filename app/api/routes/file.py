@@ -1,14 +1,17 @@
 import asyncio
 import logging
 import mimetypes
+import re
 
 from datetime import date, timedelta
 from fastapi import APIRouter, HTTPException, status, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
+from pathlib import PurePosixPath
 from sqlmodel import Session, select
 from typing import List
 
-from app.aws import S3Dependency
+from app.aws import S3Dependency, S3_MAX_POOL_CONNECTIONS
 from app.database import DbDependency
 from app.env import EnvDependency
 from app.sqlmodels import (
@@ -16,7 +19,7 @@ from app.sqlmodels import (
 )
 from app.api.routes.organisation import organisation_exists
 from app.api.routes.country import country_exists
-from app.api.routes.network import network_name_exists, get_network_by_name
+from app.api.routes.network import get_network_by_name
 from app.api.routes.deployment import deployment_name_exists
 from app.api.routes.deploymentdevice import get_deployment_by_device_and_date
 from app.api.routes.devicetype import devicetype_exists
@@ -26,8 +29,23 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/file", tags=["File"])
 
+# The maximum number of files uploaded to S3 at the same time. This matches
+# the size of the S3 connection pool.
+UPLOAD_CONCURRENCY = S3_MAX_POOL_CONNECTIONS
 
-@router.get("/", summary="List files.")
+# A file name containing control characters or a step up a directory.
+UNSAFE_FILENAME = re.compile(r'[\x00-\x1f]|(^|[/\\])\.\.([/\\]|$)')
+
+# The largest file accepted for upload. It is the API Gateway request limit,
+# which also applies when the API is run locally.
+MAX_FILE_SIZE = 10 * 1024 * 1024
+
+
+@router.get(
+    "/",
+    summary="List files.",
+    response_model=dict[str, list[str]]
+)
 async def get_files(
     s3: S3Dependency,
     db: DbDependency,
@@ -41,9 +59,9 @@ async def get_files(
     month: int | None = None,
     day: int | None = None,
 ):
-    paginator = s3.get_paginator('list_objects_v2')
-    bucket = 'lepisense-images-' + env.environment
-    prefix = validate_prefix(
+    bucket = env.images_bucket
+    prefix = await run_in_threadpool(
+        validate_prefix,
         db,
         organisation,
         country,
@@ -54,13 +72,9 @@ async def get_files(
         month,
         day
     )
-    operation_parameters = {'Bucket': bucket, 'Prefix': prefix}
-    files = []
 
     try:
-        async for page in paginator.paginate(**operation_parameters):
-            for obj in page.get('Contents', []):
-                files.append(obj['Key'])
+        files = [key async for key in list_keys(s3, bucket, prefix)]
         return {"files": files}
     except Exception as e:
         raise HTTPException(
@@ -68,7 +82,11 @@ async def get_files(
             detail=f"Failed to get files: {e.args[0]}")
 
 
-@router.get("/count", summary="Count files.")
+@router.get(
+    "/count",
+    summary="Count files.",
+    response_model=dict[str, int]
+)
 async def get_count(
     s3: S3Dependency,
     db: DbDependency,
@@ -83,8 +101,9 @@ async def get_count(
     day: int | None = None,
 ):
     paginator = s3.get_paginator('list_objects_v2')
-    bucket = 'lepisense-images-' + env.environment
-    prefix = validate_prefix(
+    bucket = env.images_bucket
+    prefix = await run_in_threadpool(
+        validate_prefix,
         db,
         organisation,
         country,
@@ -111,7 +130,9 @@ async def get_count(
 
 @router.get(
     "/presigned-url",
-    summary="Get credentials to post file directly to S3 for device on date.")
+    summary="Get credentials to post file directly to S3 for device on date.",
+    response_model=str
+)
 async def generate_presigned_url(
     s3: S3Dependency,
     db: DbDependency,
@@ -120,12 +141,19 @@ async def generate_presigned_url(
     date: date,
     filename: str
 ):
-    bucket = 'lepisense-images-' + env.environment
-    prefix = get_prefix(db, id, date)
-    key = f"{prefix}/{filename}"
+    name = clean_filename(filename)
+    if not name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file name {filename}.")
+
+    bucket = env.images_bucket
+    metadata = await run_in_threadpool(get_metadata, db, id, date)
+    prefix = get_prefix(metadata, date)
+    key = f"{prefix}/{name}"
 
     try:
-        # Generate a presigned URL for the S3
+        # Signing is done locally by the shared client without calling S3.
         presigned_url = await s3.generate_presigned_url(
             'put_object',
             Params={'Bucket': bucket, 'Key': key},
@@ -161,8 +189,9 @@ async def get_file(
     filename: str
 ):
 
-    bucket = 'lepisense-images-' + env.environment
-    prefix = validate_prefix(
+    bucket = env.images_bucket
+    prefix = await run_in_threadpool(
+        validate_prefix,
         db,
         organisation,
         country,
@@ -176,9 +205,9 @@ async def get_file(
     key = f"{prefix}/{filename}"
 
     try:
-        logger.debug(f"Requesting from S3 {key}")
+        logger.debug("Requesting from S3 %s", key)
         response = await s3.get_object(Bucket=bucket, Key=key)
-        logger.debug(f"Response from S3: {response}")
+        logger.debug("Response from S3: %s", response)
         image = await response['Body'].read()
     except s3.exceptions.NoSuchKey:
         raise HTTPException(
@@ -200,7 +229,11 @@ async def get_file(
     )
 
 
-@router.post("/", summary="Upload files.")
+@router.post(
+    "/",
+    summary="Upload files.",
+    response_model=dict[str, str]
+)
 async def upload_files(
     db: DbDependency,
     env: EnvDependency,
@@ -209,24 +242,58 @@ async def upload_files(
     date: date,
     files: List[UploadFile]
 ):
-    bucket = 'lepisense-images-' + env.environment
-    metadata = get_metadata(db, device_id, date)
+    # Reject the request before any work is done if a file name is invalid or
+    # if a file is too large. Junk files are left out and the rest uploaded.
+    uploads = []
+    for file in files:
+        name = clean_filename(file.filename)
+        if not name:
+            logger.info("Skipping %s", file.filename)
+            continue
+        file.filename = name
+        if file.size is not None and file.size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"File {file.filename} exceeds {MAX_FILE_SIZE} bytes.")
+        uploads.append(file)
+    if not uploads:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No files to upload.")
+
+    bucket = env.images_bucket
+    metadata = await run_in_threadpool(get_metadata, db, device_id, date)
     prefix = get_prefix(metadata, date)
 
-    try:
-        tasks = [upload_file(s3, bucket, prefix, file) for file in files]
-        await asyncio.gather(*tasks)
-    except Exception as e:
+    # Uploads run concurrently but are limited so that they do not queue for
+    # connections or all hold file buffers at once.
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def bounded_upload_file(file):
+        async with semaphore:
+            await upload_file(s3, bucket, prefix, file)
+
+    # Every upload is allowed to finish so that all the files which failed,
+    # rather than just the first, can be reported. The errors are logged by
+    # upload_file.
+    tasks = [bounded_upload_file(file) for file in uploads]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    failed = [
+        file.filename
+        for file, result in zip(uploads, results)
+        if isinstance(result, BaseException)
+    ]
+    if failed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to upload files: {e}")
+            detail=f"Failed to upload files: {', '.join(failed)}")
 
     deployment = metadata[2]
     deployment_id = deployment.id
 
     devicetype = metadata[4]
     night_session = devicetype.night_session
-    filetime = files[0].filename.split(".")[0]
+    filetime = uploads[0].filename.split(".")[0]
     # The file name is the form hhmmss.jpg.
     if night_session and filetime < "120000":
         # files from night session devices created before midday are
@@ -235,24 +302,60 @@ async def upload_files(
     else:
         session_date = date
 
-    create_inference(db, device_id, deployment_id, session_date)
+    await run_in_threadpool(
+        create_inference, db, device_id, deployment_id, session_date)
 
     return {"message": "All files uploaded successfully"}
 
 
+async def list_keys(s3, bucket: str, prefix: str):
+    """Yields the key of every object in the bucket with the given prefix.
+
+    A bucket listing returns at most 1000 keys so all pages are followed.
+    """
+    paginator = s3.get_paginator('list_objects_v2')
+    async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            yield obj['Key']
+
+
+def clean_filename(filename: str | None) -> str | None:
+    """Returns the name under which an uploaded file is stored.
+
+    Browsers send the relative path of each file in an uploaded folder, such
+    as dir/img.jpg, so only the last part is kept. None is returned for files
+    that a desktop adds to a folder, such as .DS_Store, or to a zip of it,
+    such as __MACOSX/, so that they can be skipped.
+    """
+    if not filename or UNSAFE_FILENAME.search(filename):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file name {filename}.")
+
+    path = PurePosixPath(filename.replace('\\', '/'))
+    if '__MACOSX' in path.parts or path.name.startswith('.'):
+        return None
+    if not path.name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file name {filename}.")
+    return path.name
+
+
 def get_metadata(db: Session, device_id: str, date: date):
 
-    device, devicetype = db.exec(
+    row = db.exec(
         select(Device, DeviceType).
         select_from(Device).
         join(DeviceType).
         where(Device.id == device_id).
         where(Device.deleted == False)  # noqa
     ).first()
-    if not device:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No device found with id {device_id}.")
+    device, devicetype = row
 
     # The device might not be deployed at the time the file is uploaded
     # if it is a manual rather than automatic submission. Therefore, we
@@ -284,23 +387,26 @@ async def upload_file(s3, bucket, prefix, file):
     # It is important to save the media type of the file in S3. If not,
     # when getting the object in future, the media type will be
     # application/octet-stream and, I suspect, base64 encoded.
-    logger.info(f"Uploading {file.filename} to {bucket}/{prefix}")
+    logger.info("Uploading %s to %s/%s", file.filename, bucket, prefix)
     media_type = mimetypes.guess_type(file.filename)[0]
     if not media_type:
         media_type = "application/octet-stream"
-    args = {'ContentType': media_type}
+    key = f"{prefix}/{file.filename}"
 
     try:
+        # UploadFile.read() is a coroutine, which upload_fileobj awaits, so
+        # the file is not read synchronously on the event loop. Files below
+        # the multipart threshold are sent with a single put_object.
         await s3.upload_fileobj(
-            file.file, bucket, f"{prefix}/{file.filename}", ExtraArgs=args)
+            file, bucket, key, ExtraArgs={'ContentType': media_type})
     except Exception as e:
         logger.error(
-            f"Error uploading {file.filename} to {bucket}/{prefix}. "
-            f"Error: {e}")
+            "Error uploading %s to %s/%s. Error: %s",
+            file.filename, bucket, prefix, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error uploading {prefix}/{file.filename}: {e.args[0]}")
-    logger.info(f"Uploaded {file.filename}")
+    logger.info("Uploaded %s", file.filename)
 
 
 def create_inference(
@@ -371,7 +477,9 @@ def validate_prefix(
         return prefix
 
     if network:
-        if network_name_exists(db, network, organisation, country):
+        # Keep the network row so the deployment check need not look it up.
+        network_row = get_network_by_name(db, network, organisation, country)
+        if network_row:
             prefix += f"/{network}"
         else:
             raise HTTPException(
@@ -382,8 +490,7 @@ def validate_prefix(
         return prefix
 
     if deployment:
-        network_id = get_network_by_name(db, network, organisation, country).id
-        if deployment_name_exists(db, deployment, network_id):
+        if deployment_name_exists(db, deployment, network_row.id):
             prefix += f"/{deployment}"
         else:
             raise HTTPException(
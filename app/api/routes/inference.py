@@ -5,7 +5,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Inference
 
 from app.api.routes.device import device_exists
@@ -40,14 +40,14 @@ class InferenceFull(InferenceBase):
     summary="List inferences.",
     response_model=list[InferenceList]
 )
-async def get_inferences(
+def get_inferences(
     db: DbDependency,
     device_id: str | None = None,
     date: date | None = None,
     completed: bool | None = None,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     query = (
         select(Inference).
@@ -58,7 +58,7 @@ async def get_inferences(
     if device_id:
         query = query.where(Inference.device_id == device_id)
     if date:
-        query = query.where(Inference.date == date)
+        query = query.where(Inference.session_date == date)
     if completed:
         query = query.where(Inference.completed == completed)
 
@@ -71,7 +71,7 @@ async def get_inferences(
     summary="Inference details.",
     response_model=InferenceFull
 )
-async def get_inference(db: DbDependency, id: int):
+def get_inference(db: DbDependency, id: int):
     return get_inference_by_id(db, id)
 
 
@@ -80,7 +80,7 @@ async def get_inference(db: DbDependency, id: int):
     summary="Update inference.",
     response_model=InferenceFull
 )
-async def update_inference(
+def update_inference(
     db: DbDependency, id: int, body: InferencePatch
 ):
     check_valid_inference(db, body, id)
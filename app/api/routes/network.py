@@ -1,10 +1,11 @@
 import logging
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Network, Deployment
 from app.api.routes.organisation import organisation_exists
 from app.api.routes.country import country_exists
@@ -19,6 +20,13 @@ class NetworkBase(BaseModel):
     organisation_name: str
     country_code: str
 
+    @model_validator(mode='after')
+    def normalise_keys(self):
+        # Foreign keys to organisation and country are stored in upper case.
+        self.organisation_name = self.organisation_name.upper()
+        self.country_code = self.country_code.upper()
+        return self
+
 
 class NetworkFull(NetworkBase):
     id: int
@@ -29,13 +37,13 @@ class NetworkFull(NetworkBase):
     summary="List networks.",
     response_model=list[NetworkFull]
 )
-async def get_networks(
+def get_networks(
     db: DbDependency,
     organisation_name: str = None,
     country_code: str = None,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     sql = (select(Network).
            where(Network.deleted == deleted).
@@ -55,18 +63,16 @@ async def get_networks(
     summary="Network details.",
     response_model=NetworkFull
 )
-async def get_network(db: DbDependency, id: int):
+def get_network(db: DbDependency, id: int):
     return get_network_by_id(db, id)
 
 
 @router.post(
     "/", summary="Create network.", response_model=NetworkFull
 )
-async def create_network(db: DbDependency, body: NetworkBase):
+def create_network(db: DbDependency, body: NetworkBase):
     check_valid_network(db, body)
     try:
-        body.organisation_name = body.organisation_name.upper()
-        body.country_code = body.country_code.upper()
         new_network = Network.model_validate(body)
         db.add(new_network)
         db.commit()
@@ -83,14 +89,12 @@ async def create_network(db: DbDependency, body: NetworkBase):
     summary="Update network.",
     response_model=NetworkFull
 )
-async def update_network(
+def update_network(
     db: DbDependency, id: int, body: NetworkBase
 ):
-    check_valid_network(db, body)
     current_network = get_network_by_id(db, id)
+    check_valid_network(db, body, current_network)
     try:
-        body.organisation_name = body.organisation_name.upper()
-        body.country_code = body.country_code.upper()
         revised_network = body.model_dump(exclude_unset=True)
         current_network.sqlmodel_update(revised_network)
         db.add(current_network)
@@ -103,8 +107,12 @@ async def update_network(
     return current_network
 
 
-@router.delete("/{id}", summary="Delete network.")
-async def delete_network(db: DbDependency, id: int):
+@router.delete(
+    "/{id}",
+    summary="Delete network.",
+    response_model=dict[str, bool]
+)
+def delete_network(db: DbDependency, id: int):
     # Check foreign key validity.
     if network_used(db, id):
         raise HTTPException(
@@ -127,9 +135,9 @@ async def delete_network(db: DbDependency, id: int):
     summary="Undelete network.",
     response_model=NetworkFull
 )
-async def undelete_network(db: DbDependency, id: int):
+def undelete_network(db: DbDependency, id: int):
     network = get_network_by_id(db, id, True)
-    check_valid_network(db, network)
+    check_network_foreign_keys(db, network)
     try:
         network.deleted = False
         db.add(network)
@@ -160,8 +168,10 @@ def get_network_by_name(
 ):
     organisation_name = organisation_name.upper()
     country_code = country_code.upper()
+    # Only the id and deleted flag are needed by callers.
     network = db.exec(
         select(Network).
+        options(load_only(Network.id, Network.deleted)).
         where(Network.name == name).
         where(Network.organisation_name == organisation_name).
         where(Network.country_code == country_code)
@@ -183,8 +193,10 @@ def network_name_exists(
 
 
 def network_exists(db: Session, id: int):
+    # Only the deleted flag is needed to determine existence.
     network = db.exec(
         select(Network).
+        options(load_only(Network.deleted)).
         where(Network.id == id)
     ).first()
     if network and network.deleted:
@@ -206,8 +218,7 @@ def network_used(db: Session, id: int):
     return True if deployments else False
 
 
-def check_valid_network(db: Session, network: NetworkBase, id: int = None):
-    # Check foreign key validity.
+def check_network_foreign_keys(db: Session, network: NetworkBase):
     if not organisation_exists(db, network.organisation_name):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -218,12 +229,18 @@ def check_valid_network(db: Session, network: NetworkBase, id: int = None):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Country {network.country_code} not found."
         )
+
+
+def check_valid_network(
+        db: Session, network: NetworkBase, current_network: Network = None
+):
+    # Check foreign key validity.
+    check_network_foreign_keys(db, network)
     # Maintain unique network names for an organisation and country.
     check_unique = True
-    if id:
+    if current_network:
         # When updating, a uniqueness check is not done if organisation,
         # country and name have not changed.
-        current_network = get_network_by_id(db, id)
         check_unique = (
             current_network.organisation_name != network.organisation_name or
             current_network.country_code != network.country_code or
@@ -1,10 +1,11 @@
 import logging
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
-from app.database import DbDependency
+from app.database import DbDependency, Limit, Offset
 from app.sqlmodels import Organisation, Network, Account
 
 logger = logging.getLogger(__name__)
@@ -19,17 +20,23 @@ class OrganisationBase(BaseModel):
 class OrganisationFull(OrganisationBase):
     name: str = Field(description="A short, unique, organisation name.")
 
+    @model_validator(mode='after')
+    def normalise_name(self):
+        # Organisation names are stored in upper case.
+        self.name = self.name.upper()
+        return self
+
 
 @router.get(
     "/",
     summary="List organisations.",
     response_model=list[OrganisationFull]
 )
-async def get_organisations(
+def get_organisations(
     db: DbDependency,
     deleted: bool = False,
-    offset: int = 0,
-    limit: int = 100
+    offset: Offset = 0,
+    limit: Limit = 100
 ):
     organisations = db.exec(
         select(Organisation).
@@ -45,14 +52,14 @@ async def get_organisations(
     summary="Organisation details.",
     response_model=OrganisationFull
 )
-async def get_organisation(db: DbDependency, name: str):
+def get_organisation(db: DbDependency, name: str):
     return get_organisation_by_name(db, name)
 
 
 @router.post(
     "/", summary="Create organisation.", response_model=OrganisationFull
 )
-async def create_organisation(
+def create_organisation(
     db: DbDependency, body: OrganisationFull
 ):
     if organisation_exists(db, body.name):
@@ -61,7 +68,6 @@ async def create_organisation(
             detail=f"Organisation {body.name} already exists.")
 
     try:
-        body.name = body.name.upper()
         new_organisation = Organisation.model_validate(body)
         db.add(new_organisation)
         db.commit()
@@ -78,7 +84,7 @@ async def create_organisation(
     summary="Update organisation.",
     response_model=OrganisationFull
 )
-async def update_organisation(
+def update_organisation(
     db: DbDependency, name: str, body: OrganisationBase
 ):
     current_organisation = get_organisation_by_name(db, name)
@@ -95,8 +101,12 @@ async def update_organisation(
     return current_organisation
 
 
-@router.delete("/{name}", summary="Delete organisation.")
-async def delete_organisation(db: DbDependency, name: str):
+@router.delete(
+    "/{name}",
+    summary="Delete organisation.",
+    response_model=dict[str, bool]
+)
+def delete_organisation(db: DbDependency, name: str):
     if organisation_used(db, name):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -118,7 +128,7 @@ async def delete_organisation(db: DbDependency, name: str):
     summary="Undelete organisation.",
     response_model=OrganisationFull
 )
-async def undelete_organisation(db: DbDependency, name: str):
+def undelete_organisation(db: DbDependency, name: str):
     organisation = get_organisation_by_name(db, name, True)
     try:
         organisation.deleted = False
@@ -148,8 +158,10 @@ def get_organisation_by_name(db: Session, name: str, deleted: bool = False):
 
 def organisation_exists(db: Session, name: str):
     name = name.upper()
+    # Only the deleted flag is needed to determine existence.
     organisation = db.exec(
         select(Organisation).
+        options(load_only(Organisation.deleted)).
         where(Organisation.name == name)
     ).first()
     if organisation and organisation.deleted:
@@ -1,13 +1,16 @@
+import base64
 import bcrypt
+import hmac
+import jwt
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Annotated, TypeAlias
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 from sqlmodel import Session, select
 
-from app.constants import Role
+from app.constants import Role, RoleLevel, ROLE_LEVEL
 from app.database import DbDependency
 from app.env import EnvDependency
 from app.sqlmodels import Account
@@ -53,6 +56,15 @@ def hash_password(password: str):
     return hashed_password
 
 
+@lru_cache
+def get_jwt_key(key: str, algorithm: str):
+    """Returns a signing key object, built once and kept in memory."""
+    k = base64.urlsafe_b64encode(key.encode('utf-8')).rstrip(b'=')
+    return jwt.PyJWK(
+        {"kty": "oct", "k": k.decode('ascii'), "alg": algorithm}
+    )
+
+
 def create_access_token(
         env, data: dict, expires_delta: timedelta | None = None
 ):
@@ -63,8 +75,8 @@ def create_access_token(
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, env.jwt_key,
-                             algorithm=env.jwt_algorithm)
+    key = get_jwt_key(env.jwt_key, env.jwt_algorithm)
+    encoded_jwt = jwt.encode(to_encode, key)
     return encoded_jwt
 
 
@@ -72,14 +84,21 @@ def authenticate_account(
         env: EnvDependency, db: Session, name: str, password: str
 ):
     """Confirms a name and password match."""
-    if name == env.userone_name and password == env.userone_pass:
-        return Account(name=name, role=Role.ROOT.value)
+    # A constant-time comparison avoids leaking the root password through
+    # response timing. The root name cannot be used by database accounts.
+    if name == env.userone_name:
+        if hmac.compare_digest(
+            password.encode('utf-8'), env.userone_pass.encode('utf-8')
+        ):
+            return Account(name=name, role=Role.ROOT.value)
+        return False
 
     account = db.exec(
         select(Account)
         .where(Account.name == name)
     ).one_or_none()
     if not account:
+        # No bcrypt check is made for unknown accounts.
         return False
     if not verify_password(password, account.hash):
         return False
@@ -93,12 +112,12 @@ def get_current_account(
 ):
     """Confirms an access token is valid."""
     try:
-        payload = jwt.decode(token, env.jwt_key,
-                             algorithms=[env.jwt_algorithm])
+        key = get_jwt_key(env.jwt_key, env.jwt_algorithm)
+        payload = jwt.decode(token, key,
+                             algorithms=[env.jwt_algorithm],
+                             options={"require": ["exp", "sub"]})
         name: str = payload.get("sub")
-        if name is None:
-            raise authentication_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise authentication_exception
 
     if name == env.userone_name:
@@ -115,15 +134,16 @@ def get_current_account(
     return account
 
 
+def role_level(account: Account):
+    """Returns the level of an account's role, -1 if the role is unknown."""
+    return ROLE_LEVEL.get(account.role, -1)
+
+
 def get_current_write_account(
     account:  Annotated[Account, Depends(get_current_account)]
 ):
     """Confirms an access token is valid for a write role."""
-    if (
-        not account.role == Role.WRITE.value and
-        not account.role == Role.ADMIN.value and
-        not account.role == Role.ROOT.value
-    ):
+    if role_level(account) < RoleLevel.WRITE:
         raise authorization_exception
     return account
 
@@ -132,10 +152,7 @@ def get_current_admin_account(
     account:  Annotated[Account, Depends(get_current_account)]
 ):
     """Confirms an access token is valid for an admin role."""
-    if (
-        not account.role == Role.ADMIN.value and
-        not account.role == Role.ROOT.value
-    ):
+    if role_level(account) < RoleLevel.ADMIN:
         raise authorization_exception
     return account
 
@@ -144,9 +161,7 @@ def get_current_root_account(
     account:  Annotated[Account, Depends(get_current_account)]
 ):
     """Confirms an access token is valid for a root role."""
-    if (
-        not account.role == Role.ROOT.value
-    ):
+    if role_level(account) < RoleLevel.ROOT:
         raise authorization_exception
     return account
 
@@ -163,8 +178,9 @@ RootDependency: TypeAlias = Annotated[Account, Depends(
 @router.post(
     "/token",
     tags=['Service'],
-    summary="Login account.")
-async def login(
+    summary="Login account.",
+    response_model=dict[str, str])
+def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: DbDependency,
     env: EnvDependency
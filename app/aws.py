@@ -1,18 +1,65 @@
+import asyncio
 import logging
 
 from aioboto3 import Session
 from botocore.client import BaseClient
+from botocore.config import Config
 from fastapi import Depends
+from functools import lru_cache
 from typing import Annotated
 
 logger = logging.getLogger()
 
+# The size of the S3 connection pool. It is twice the botocore default so
+# that concurrent uploads do not wait for a connection.
+S3_MAX_POOL_CONNECTIONS = 20
+
+
+@lru_cache
+def get_session():
+    # A cached function so that the session, which loads the service models
+    # and resolves credentials, is only created once.
+    return Session()
+
+
+@lru_cache
+def get_s3_config():
+    # A cached function so that the same config is used by every client.
+    # Adaptive retries back off exponentially, with jitter, and also slow the
+    # rate of new requests when S3 responds with SlowDown. Attempts are
+    # limited so that retries finish within the Lambda timeout.
+    return Config(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        retries={"mode": "adaptive", "max_attempts": 5}
+    )
+
+
+# The S3 client, opened on first use and then kept until the server stops so
+# that its connections are reused by later requests. Mangum runs every
+# invocation on the same event loop, which the client is bound to.
+_s3_client = None
+_s3_client_lock = asyncio.Lock()
+
 
 async def get_s3_client():
     """A function for injecting an s3 client as a dependency."""
-    session = Session()
-    async with session.client('s3') as s3:
-        yield s3
+    global _s3_client
+
+    if _s3_client is None:
+        async with _s3_client_lock:
+            if _s3_client is None:
+                client = get_session().client('s3', config=get_s3_config())
+                _s3_client = await client.__aenter__()
+    return _s3_client
+
+
+async def close_s3_client():
+    """Closes the S3 client, if open, releasing its connections."""
+    global _s3_client
+
+    if _s3_client is not None:
+        client, _s3_client = _s3_client, None
+        await client.__aexit__(None, None, None)
 
 
 # Create an annotated dependency for brevity when defining an endpoint needing
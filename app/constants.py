@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class Role(str, Enum):
@@ -6,3 +6,15 @@ class Role(str, Enum):
     WRITE = 'write'
     ADMIN = 'admin'
     ROOT = 'root'
+
+
+class RoleLevel(IntEnum):
+    # Roles are ordered so that each includes the permissions of those below.
+    READ = 0
+    WRITE = 1
+    ADMIN = 2
+    ROOT = 3
+
+
+# Look up the level of a role from its stored string value.
+ROLE_LEVEL = {role.value: RoleLevel[role.name] for role in Role}
@@ -1,37 +1,69 @@
 import logging
 
-from fastapi import Request, Depends
+from contextlib import ExitStack
+from fastapi import Request, Depends, Query
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
 from sqlmodel import create_engine, SQLModel, Session
 from typing import Annotated
 
-from app.env import EnvSettings
-# Importing sqlmodels ensures the tables are created in the database.
-import app.sqlmodels  # noqa F401
+from app.env import AllSettings
 
 logger = logging.getLogger()
 
-
-def create_db(env: EnvSettings):
-
-    pg_url = (
-        f"postgresql://{env.postgres_user}:{env.postgres_password}@"
-        f"{env.postgres_host}:{env.postgres_port}/{env.postgres_db}"
+# Seconds to wait for a database connection. This keeps an unreachable
+# database from using up the 10 second Lambda init phase while warming the
+# pool at import.
+DB_CONNECT_TIMEOUT = 5
+
+
+def create_db(env: AllSettings):
+
+    # Log SQL queries if log_level is debug. Rather than using echo, which
+    # adds its own handler, this goes through the configured root logger.
+    if env.log_level == 'debug':
+        logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
+    engine = create_engine(
+        env.pg_url,
+        poolclass=QueuePool,
+        pool_size=env.db_pool_size,
+        max_overflow=env.db_max_overflow,
+        pool_timeout=env.db_pool_timeout,
+        # Recycle connections before network idle timeouts close them and
+        # test connections on checkout in case they were closed anyway.
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        # Fail rather than hang if the database cannot be reached.
+        connect_args={"connect_timeout": DB_CONNECT_TIMEOUT}
     )
-
-    # Log SQL queries if log_level is debug or info.
-    echo = True if env.log_level in ['debug', 'info'] else False
-    engine = create_engine(pg_url, echo=echo)
     return engine
 
-    # To initialise the database, call the database/reset API endpoint.
+    # To initialise the database, call the database/upgrade API endpoint or,
+    # outside of production, the database/reset API endpoint.
+
 
+def warm_db(engine, connections: int):
+    """Opens pool connections so that early requests need not wait for them."""
+    try:
+        # Hold the connections open together so that each is a new one. The
+        # stack returns every one opened to the pool, even after an error.
+        with ExitStack() as stack:
+            for _ in range(connections):
+                conn = stack.enter_context(engine.connect())
+                conn.execute(text("SELECT 1"))
+    except Exception:
+        logger.warning("Error warming database pool.", exc_info=True)
 
-def init_db(engine):
-    SQLModel.metadata.create_all(engine)
+
+def init_db(engine, checkfirst: bool = True):
+    # Importing sqlmodels ensures the tables are in the metadata.
+    import app.sqlmodels  # noqa F401
+    SQLModel.metadata.create_all(engine, checkfirst=checkfirst)
     logger.info("Database created.")
 
 
 def delete_db(engine):
+    import app.sqlmodels  # noqa F401
     SQLModel.metadata.drop_all(engine)
     logger.info("Database deleted.")
 
@@ -43,5 +75,17 @@ def get_db_session(request: Request):
 
 
 # Create an annotated dependency for brevity when defining an endpoint needing
-# a database session.
+# a database session. The session is synchronous so endpoints using it should
+# be declared with def rather than async def. FastAPI then runs them in a
+# thread pool so that they do not block the event loop. Async endpoints must
+# call database functions through run_in_threadpool.
 DbDependency = Annotated[Session, Depends(get_db_session)]
+
+
+# The maximum number of records a list endpoint will return in one request.
+# Larger result sets must be paged through using offset.
+MAX_LIMIT = 1000
+
+# Create annotated query parameters for paging through list endpoints.
+Offset = Annotated[int, Query(ge=0)]
+Limit = Annotated[int, Query(ge=1, le=MAX_LIMIT)]
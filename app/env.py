@@ -1,12 +1,19 @@
 import boto3
-import json
 import logging
+import orjson
+import os
+import time
+import urllib.request
 
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import Depends
-from functools import lru_cache
+from fastapi.concurrency import run_in_threadpool
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import URL
 from typing import Annotated
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,18 @@ class EnvSettings(BaseSettings):
     jwt_secret_arn: str = ''
     environment: str = 'prod'  # ['dev'|'test'|'prod']
     log_level: str = 'warning'  # [debug|info|warning|error|critical]
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout: int = 30  # seconds
+    db_pool_warm: int = 1  # connections opened at startup
+    # Port of the AWS Parameters and Secrets Lambda Extension. When 0, secrets
+    # are obtained from Secrets Manager using boto3.
+    secrets_extension_port: int = 0
+    # Minutes before secrets are fetched again so that rotated JWT and
+    # userone values are picked up without a redeployment. The database
+    # engine keeps the credentials it was created with, so a rotated database
+    # password still needs a redeployment.
+    secrets_refresh_minutes: int = 60
 
     # Settings are obtained in order of preference from the following sources:
     # 1. Environment variables.
@@ -28,7 +47,9 @@ class EnvSettings(BaseSettings):
     # in development.
     # Making the settings frozen means they are hashable.
     # https://github.com/fastapi/fastapi/issues/1985#issuecomment-1290899088
-    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+    # Defaults are of the right type so need not be validated.
+    model_config = SettingsConfigDict(
+        env_file=".env", frozen=True, validate_default=False)
 
 
 @lru_cache
@@ -41,9 +62,14 @@ def get_env_settings():
 
 class AllSettings(BaseSettings):
     # Intentionally not using pydantic-settings-aws module as I don't want it
-    # to keep refreshing the secrets (should the lambda ever live that long).
+    # to refresh the secrets on every access. Instead, get_all_settings()
+    # refreshes them after secrets_refresh_minutes.
     environment: str = 'prod'  # ['dev'|'test'|'prod']
     log_level: str = 'warning'  # [debug|info|warning|error|critical]
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout: int = 30  # seconds
+    db_pool_warm: int = 1  # connections opened at startup
     postgres_host: str = ''
     postgres_port: int = 5432
     postgres_user: str = 'postgres'
@@ -55,47 +81,165 @@ class AllSettings(BaseSettings):
     jwt_algorithm: str = ''
     jwt_expires_minutes: int = 0
 
-    model_config = SettingsConfigDict(frozen=True)
+    model_config = SettingsConfigDict(frozen=True, validate_default=False)
+
+    @cached_property
+    def pg_url(self) -> URL:
+        """The database URL, built once. URL.create() escapes the password."""
+        return URL.create(
+            "postgresql+psycopg",
+            username=self.postgres_user,
+            password=self.postgres_password,
+            host=self.postgres_host,
+            port=self.postgres_port,
+            database=self.postgres_db
+        )
+
+    @cached_property
+    def images_bucket(self) -> str:
+        """The name of the S3 bucket holding images for the environment."""
+        return 'lepisense-images-' + self.environment
 
 
 @lru_cache
-def get_all_settings():
-    # A cached function keeping settings in memory.
+def get_boto3_session():
+    # A cached function so that credentials are only resolved once.
+    return boto3.session.Session()
 
-    env_settings = get_env_settings()
-    # Load secrets from AWS Secrets Manager.
-    # Consider using batch_get_secrets to get multiple secrets at once.
-    client = boto3.client("secretsmanager")
 
+@lru_cache
+def get_secrets_client():
+    # A cached function so that the client is only created once.
+    # Keepalive lets the connection be reused between invocations.
+    config = Config(
+        retries={"mode": "standard", "max_attempts": 2},
+        tcp_keepalive=True
+    )
+    return get_boto3_session().client("secretsmanager", config=config)
+
+
+def get_extension_secret_string(port: int, secret_id: str):
+    """Gets the value of a secret from the Lambda extension.
+
+    The extension caches secrets so, after the first request, this avoids a
+    call to Secrets Manager.
+    """
+    request = urllib.request.Request(
+        f"http://localhost:{port}/secretsmanager/get?secretId="
+        f"{quote(secret_id, safe='')}",
+        headers={
+            "X-Aws-Parameters-Secrets-Token": os.environ["AWS_SESSION_TOKEN"]
+        }
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        secret = orjson.loads(response.read())
+    return secret["SecretString"]
+
+
+def get_secret_strings(secret_ids: list[str], extension_port: int = 0):
+    """Gets the value of several secrets in one call to Secrets Manager.
+
+    If an extension_port is given, the secrets are obtained from the Lambda
+    extension instead, falling back to Secrets Manager if that fails.
+
+    Returns the secret strings in the same order as the secret_ids, which may
+    be names or ARNs.
+    """
+    if extension_port:
+        try:
+            return [
+                get_extension_secret_string(extension_port, secret_id)
+                for secret_id in secret_ids
+            ]
+        except OSError:
+            # The extension may not be ready or may be failing so fall back
+            # to calling Secrets Manager directly.
+            logger.warning(
+                "Error getting secrets from the Lambda extension.",
+                exc_info=True
+            )
+
+    client = get_secrets_client()
     try:
-        postgres_secret = client.get_secret_value(
-            SecretId=env_settings.postgres_secret_name
-        )
-        userone_secret = client.get_secret_value(
-            SecretId=env_settings.userone_secret_arn
-        )
-        jwt_secret = client.get_secret_value(
-            SecretId=env_settings.jwt_secret_arn
-        )
+        response = client.batch_get_secret_value(SecretIdList=secret_ids)
     except ClientError as e:
         logger.error(e)
         raise e
 
-    postgres_secret = postgres_secret["SecretString"]
-    postgres_secret = json.loads(postgres_secret)
+    errors = response.get("Errors", [])
+    if errors:
+        error = errors[0]
+        logger.error(error)
+        raise RuntimeError(
+            f"Failed to get secret {error['SecretId']}: {error['Message']}")
+
+    secret_strings = {}
+    for secret in response["SecretValues"]:
+        secret_strings[secret["ARN"]] = secret["SecretString"]
+        secret_strings[secret["Name"]] = secret["SecretString"]
+    return [secret_strings[secret_id] for secret_id in secret_ids]
+
+
+# The settings held in memory and the time, by time.monotonic(), after which
+# they must be reloaded.
+_all_settings = None
+_all_settings_expiry = 0.0
+
+# Seconds before trying again when reloading settings has failed.
+SETTINGS_RETRY_SECONDS = 60
+
+
+def get_all_settings():
+    # A cached function keeping settings in memory until they expire.
+    global _all_settings, _all_settings_expiry
+
+    now = time.monotonic()
+    if _all_settings is None:
+        # There is nothing to fall back on at startup so errors are raised.
+        # The Lambda extension does not serve requests during INIT so it is
+        # only used for later reloads.
+        env_settings = get_env_settings()
+        _all_settings = load_all_settings(env_settings, use_extension=False)
+        _all_settings_expiry = (
+            now + env_settings.secrets_refresh_minutes * 60)
+    elif now >= _all_settings_expiry:
+        env_settings = get_env_settings()
+        try:
+            _all_settings = load_all_settings(env_settings)
+            _all_settings_expiry = (
+                now + env_settings.secrets_refresh_minutes * 60)
+        except Exception:
+            # Keep serving the settings already loaded and try again later
+            # rather than failing, or retrying on, every request.
+            logger.error("Error reloading settings.", exc_info=True)
+            _all_settings_expiry = now + SETTINGS_RETRY_SECONDS
+    return _all_settings
+
+
+def load_all_settings(env_settings: EnvSettings, use_extension: bool = True):
+    """Combines the environment settings with secrets."""
+    # Load secrets from AWS Secrets Manager.
+    postgres_secret, userone_secret, jwt_secret = get_secret_strings(
+        [
+            env_settings.postgres_secret_name,
+            env_settings.userone_secret_arn,
+            env_settings.jwt_secret_arn
+        ],
+        env_settings.secrets_extension_port if use_extension else 0
+    )
+
+    postgres_secret = orjson.loads(postgres_secret)
     postgres_host = postgres_secret["host"]
     postgres_port = postgres_secret["port"]
     postgres_user = postgres_secret["username"]
     postgres_password = postgres_secret["password"]
     postgres_db = postgres_secret["dbname"]
 
-    userone_secret = userone_secret["SecretString"]
-    userone_secret = json.loads(userone_secret)
+    userone_secret = orjson.loads(userone_secret)
     userone_name = userone_secret["username"]
     userone_pass = userone_secret["password"]
 
-    jwt_secret = jwt_secret["SecretString"]
-    jwt_secret = json.loads(jwt_secret)
+    jwt_secret = orjson.loads(jwt_secret)
     jwt_key = jwt_secret["key"]
     jwt_algorithm = jwt_secret["algorithm"]
     jwt_expires_minutes = jwt_secret["expires_minutes"]
@@ -103,6 +247,10 @@ def get_all_settings():
     all_settings = AllSettings(
         environment=env_settings.environment,
         log_level=env_settings.log_level,
+        db_pool_size=env_settings.db_pool_size,
+        db_max_overflow=env_settings.db_max_overflow,
+        db_pool_timeout=env_settings.db_pool_timeout,
+        db_pool_warm=env_settings.db_pool_warm,
         postgres_host=postgres_host,
         postgres_port=postgres_port,
         postgres_user=postgres_user,
@@ -117,6 +265,19 @@ def get_all_settings():
     return all_settings
 
 
+async def get_settings():
+    """A function for injecting settings as a dependency.
+
+    FastAPI runs a plain def dependency in a thread pool on every request.
+    Being async, this is called directly on the event loop instead. Only
+    when the settings have expired is the thread pool used, as reloading
+    them blocks while secrets are fetched.
+    """
+    if time.monotonic() < _all_settings_expiry:
+        return _all_settings
+    return await run_in_threadpool(get_all_settings)
+
+
 # Create an annotated dependency for brevity when defining an endpoint needing
 # settings.
-EnvDependency = Annotated[AllSettings, Depends(get_all_settings)]
+EnvDependency = Annotated[AllSettings, Depends(get_settings)]
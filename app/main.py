@@ -1,14 +1,18 @@
 import logging
 import sys
 
-from app.database import create_db
+from app.aws import close_s3_client
+from app.database import create_db, warm_db
 from app.env import get_all_settings
 from app.api.main import router
+from app.api.routes.file import MAX_FILE_SIZE
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from mangum import Mangum
+from starlette.formparsers import MultiPartParser
 
 
 # Load settings.
@@ -31,6 +35,19 @@ except Exception:
     sys.exit(1)
 logger.info("Database initialised.")
 
+# Open connections now, during the Lambda init phase, so the first request
+# does not wait for them. This is not done in a lifespan handler as Mangum
+# runs those on every invocation.
+warm_db(engine, env.db_pool_warm)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the connections of the S3 client when the server stops.
+    await close_s3_client()
+
+
 # Instantiate the app.
 app = FastAPI(
     title="LepiSense Input API",
@@ -45,10 +62,12 @@ app = FastAPI(
     license_info={
         "name": "Apache 2.0",
         "identifier": "MIT",
-    }
+    },
+    lifespan=lifespan
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+# Level 1 gives most of the size reduction for JSON at a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1500, compresslevel=1)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -56,10 +75,25 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Uploaded files are held in memory until they exceed this size, after which
+# they are written to disk. The 1MB default sent most images to /tmp only for
+# them to be read back to send to S3. At this size, uploads are never written
+# to disk. This applies to every form parsed in the process.
+MultiPartParser.spool_max_size = MAX_FILE_SIZE
+
 # Store the engine in the app.state so it is available in requests.
 app.state.engine = engine
 
 # Attach all the routes we serve.
 app.include_router(router)
 
-handler = Mangum(app, lifespan="on")
+# Mangum would run the lifespan on every invocation, closing the S3 client
+# after each request. On Lambda, the client lives as long as the process.
+handler = Mangum(app, lifespan="off")
+
+if __name__ == "__main__":
+    # Run outside of Lambda with `python -m app.main`. This needs
+    # uvicorn[standard], which provides the uvloop event loop and httptools
+    # parser used here in place of the slower pure-Python defaults.
+    import uvicorn
+    uvicorn.run(app, loop="uvloop", http="httptools")
@@ -1,6 +1,7 @@
 from datetime import date
+from typing import Any
 from sqlalchemy import false, true
-from sqlmodel import SQLModel, Column, Field, LargeBinary
+from sqlmodel import SQLModel, Column, Field, Index, LargeBinary
 
 
 # Create a naming convention.
@@ -13,22 +14,21 @@ SQLModel.metadata.naming_convention = {
 }
 
 
+def false_field() -> Any:
+    """A boolean field defaulting to false, both in Python and the database."""
+    return Field(default=False, sa_column_kwargs={'server_default': false()})
+
+
 class Organisation(SQLModel, table=True):
     name: str = Field(primary_key=True)
     full_name: str
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class Country(SQLModel, table=True):
     code: str = Field(primary_key=True)
     name: str
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class Network(SQLModel, table=True):
@@ -36,10 +36,7 @@ class Network(SQLModel, table=True):
     organisation_name: str = Field(foreign_key='organisation.name', index=True)
     country_code: str = Field(foreign_key='country.code', index=True)
     name: str
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class Deployment(SQLModel, table=True):
@@ -50,14 +47,8 @@ class Deployment(SQLModel, table=True):
     description: str | None
     latitude: float
     longitude: float
-    active: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    active: bool = false_field()
+    deleted: bool = false_field()
 
 
 class Device(SQLModel, table=True):
@@ -67,10 +58,7 @@ class Device(SQLModel, table=True):
     version: str
     current_deployment_id: int | None = Field(
         foreign_key='deployment.id', index=True)
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class DeviceType(SQLModel, table=True):
@@ -86,10 +74,7 @@ class DeviceType(SQLModel, table=True):
             "to the starting day."
         )
     )
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class DeploymentDevice(SQLModel, table=True):
@@ -98,10 +83,7 @@ class DeploymentDevice(SQLModel, table=True):
     deployment_id: int = Field(foreign_key='deployment.id', index=True)
     start_date: date
     end_date: date | None
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    deleted: bool = false_field()
 
 
 class Account(SQLModel, table=True):
@@ -111,19 +93,23 @@ class Account(SQLModel, table=True):
     email: str
     hash: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
     role: str
-    disabled: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    disabled: bool = false_field()
+    deleted: bool = false_field()
 
 
 class Inference(SQLModel, table=True):
+    # Inferences are looked up by device and session date. The composite index
+    # also serves queries on device_id alone.
+    __table_args__ = (
+        Index(
+            'ix_inference_device_id_session_date',
+            'device_id',
+            'session_date'
+        ),
+    )
+
     id: int | None = Field(primary_key=True, default=None)
-    device_id: str = Field(foreign_key='device.id', index=True)
+    device_id: str = Field(foreign_key='device.id')
     deployment_id: int = Field(foreign_key='deployment.id', index=True)
     session_date: date = Field(
         index=True,
@@ -139,11 +125,5 @@ class Inference(SQLModel, table=True):
             "Reset to None on completion."
         )
     )
-    completed: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
-    deleted: bool = Field(
-        default=False,
-        sa_column_kwargs={'server_default': false()}
-    )
+    completed: bool = false_field()
+    deleted: bool = false_field()
@@ -0,0 +1,120 @@
+import orjson
+import unittest
+import urllib.error
+
+from unittest import mock
+
+from app import env
+
+SECRET_IDS = ["postgres", "userone", "jwt"]
+
+# A secret string holding the keys of every secret loaded by the settings.
+SETTINGS_SECRET = orjson.dumps({
+    "host": "localhost", "port": 5432, "username": "user",
+    "password": "pass", "dbname": "db", "key": "key",
+    "algorithm": "HS256", "expires_minutes": 30
+}).decode()
+
+
+def batch_response(secret_ids):
+    return {
+        "SecretValues": [
+            {
+                "ARN": f"arn:{secret_id}",
+                "Name": secret_id,
+                "SecretString": f"value of {secret_id}"
+            }
+            for secret_id in secret_ids
+        ],
+        "Errors": []
+    }
+
+
+def not_ready(port, secret_id):
+    raise urllib.error.HTTPError(
+        f"http://localhost:{port}", 400, "not ready to serve traffic",
+        None, None
+    )
+
+
+class TestGetSecretStrings(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.batch_get_secret_value.return_value = (
+            batch_response(SECRET_IDS))
+        patcher = mock.patch.object(
+            env, "get_secrets_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_falls_back_when_extension_not_ready(self):
+        with mock.patch.object(
+            env, "get_extension_secret_string", side_effect=not_ready
+        ):
+            secrets = env.get_secret_strings(SECRET_IDS, 2773)
+
+        self.assertEqual(
+            secrets, [f"value of {secret_id}" for secret_id in SECRET_IDS])
+        self.client.batch_get_secret_value.assert_called_once_with(
+            SecretIdList=SECRET_IDS)
+
+    def test_uses_extension_when_ready(self):
+        with mock.patch.object(
+            env, "get_extension_secret_string",
+            side_effect=lambda port, secret_id: f"cached {secret_id}"
+        ):
+            secrets = env.get_secret_strings(SECRET_IDS, 2773)
+
+        self.assertEqual(
+            secrets, [f"cached {secret_id}" for secret_id in SECRET_IDS])
+        self.client.batch_get_secret_value.assert_not_called()
+
+    def test_raises_on_secrets_manager_error(self):
+        self.client.batch_get_secret_value.return_value = {
+            "SecretValues": [],
+            "Errors": [{"SecretId": "jwt", "Message": "Not found"}]
+        }
+        with self.assertRaises(RuntimeError):
+            env.get_secret_strings(SECRET_IDS)
+
+
+class TestGetAllSettings(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            env, _all_settings=None, _all_settings_expiry=0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_load_does_not_use_extension(self):
+        env_settings = env.EnvSettings(
+            postgres_secret_name="postgres",
+            userone_secret_arn="userone",
+            jwt_secret_arn="jwt",
+            secrets_extension_port=2773
+        )
+        with (
+            mock.patch.object(
+                env, "get_env_settings", return_value=env_settings),
+            mock.patch.object(
+                env, "get_extension_secret_string", side_effect=not_ready
+            ) as extension,
+            mock.patch.object(
+                env, "get_secret_strings", wraps=env.get_secret_strings
+            ) as get_secret_strings,
+            mock.patch.object(env, "get_secrets_client") as client,
+        ):
+            response = batch_response(SECRET_IDS)
+            for secret in response["SecretValues"]:
+                secret["SecretString"] = SETTINGS_SECRET
+            client.return_value.batch_get_secret_value.return_value = response
+            settings = env.get_all_settings()
+
+        self.assertEqual(get_secret_strings.call_args.args[1], 0)
+        extension.assert_not_called()
+        self.assertEqual(settings.postgres_host, "localhost")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from fastapi import HTTPException
+
+from app.api.routes.file import clean_filename
+
+
+class TestCleanFilename(unittest.TestCase):
+
+    def test_keeps_plain_name(self):
+        self.assertEqual(clean_filename("120000.jpg"), "120000.jpg")
+
+    def test_strips_folder_from_name(self):
+        self.assertEqual(clean_filename("dir/120000.jpg"), "120000.jpg")
+        self.assertEqual(clean_filename("a/b/120000.jpg"), "120000.jpg")
+        self.assertEqual(clean_filename("dir\\120000.jpg"), "120000.jpg")
+
+    def test_skips_junk(self):
+        self.assertIsNone(clean_filename(".DS_Store"))
+        self.assertIsNone(clean_filename("dir/.DS_Store"))
+        self.assertIsNone(clean_filename("__MACOSX/dir/._120000.jpg"))
+
+    def test_rejects_unsafe_name(self):
+        for filename in [
+            "", "..", "../120000.jpg", "dir/../120000.jpg", "/",
+            "120000.jpg\n", "120000\x00.jpg"
+        ]:
+            with self.subTest(filename=filename):
+                with self.assertRaises(HTTPException) as cm:
+                    clean_filename(filename)
+                self.assertEqual(cm.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()